@@ -1,8 +1,30 @@
+from pathlib import Path
+
 import streamlit as st
 
 from travel_logic import generate_itinerary, load_places_data
 
 
+# Font and accent colour come from the theme in .streamlit/config.toml.
+# The remaining rules (visible links, card-style layout, pill button)
+# live in static/app.css and are read once at import, so a rerun only
+# re-emits this short prepared <style> block.
+_CSS_STYLE = (
+    "<style>\n"
+    + (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+    + "</style>"
+)
+
+
+def _inject_css() -> None:
+    """Apply the custom styles.
+
+    Streamlit rebuilds the page on every rerun, so the style block is
+    emitted each time.
+    """
+    st.markdown(_CSS_STYLE, unsafe_allow_html=True)
+
+
 def main() -> None:
     """Streamlit UI for the AI-based student travel planner.
 
@@ -17,90 +39,7 @@ def main() -> None:
         layout="centered",
     )
 
-    # Global font and basic theming: Times New Roman for main text,
-    # clearer headings, and visible links with a soft card-style layout.
-    st.markdown(
-        """
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&display=swap');
-
-        /* Use Inter for main content in the app */
-        html, body,
-        [class^="css"],
-        .stMarkdown, .stText,
-        .stButton > button,
-        input, textarea, select,
-        .stSelectbox, .stMultiSelect, .stNumberInput,
-        .stTextInput, .stDateInput, .stRadio, .stCheckbox,
-        .stAlert, .stSidebar, .st-expander, .st-expanderHeader,
-        .st-bw, .st-bx, .st-by, .st-bz {
-            font-family: "Inter", sans-serif !important;
-        }
-
-        h1, h2, h3, h4, h5, h6 {
-            font-family: "Inter", sans-serif !important;
-            font-weight: bold;
-        }
-
-        /* Make links clearly visible */
-        a, .stMarkdown a {
-            color: #0056b3 !important;
-            text-decoration: underline !important;
-        }
-
-        /* Page background and main container */
-        body {
-            background: radial-gradient(circle at top, #fdfbfb 0, #ebedee 55%, #e2e2f0 100%);
-        }
-
-        .block-container {
-            max-width: 800px;
-            margin: auto;
-            padding-top: 1.5rem;
-            padding-bottom: 2rem;
-        }
-
-        /* Cards for summary and sections */
-        .stMarkdown h2, .stMarkdown h3 {
-            margin-top: 1.8rem;
-        }
-
-        .summary-card, .tips-card {
-            background-color: #ffffff;
-            border-radius: 12px;
-            padding: 1.25rem 1.5rem;
-            box-shadow: 0 3px 10px rgba(0, 0, 0, 0.06);
-            margin-bottom: 1.2rem;
-        }
-
-        /* Nicer expanders for each day */
-        .st-expander {
-            background-color: #ffffff !important;
-            border-radius: 10px !important;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-            margin-bottom: 0.9rem;
-        }
-
-        .st-expander summary {
-            font-weight: 600;
-        }
-
-        /* Primary button styling */
-        .stButton > button {
-            background-color: #0056b3 !important;
-            color: #ffffff !important;
-            border-radius: 999px !important;
-            padding: 0.4rem 1.4rem !important;
-            border: none !important;
-        }
-
-        .stButton > button:hover {
-            background-color: #004495 !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    _inject_css()
 
     st.title("Student Travel Planner")
     st.write("Plan a simple, budget-friendly trip in a few clicks.")
@@ -139,13 +78,14 @@ def main() -> None:
 
     if submitted:
         with st.spinner("Creating your itinerary..."):
+            # Without places_data, travel_logic caches results for the
+            # bundled data file and notices when it is rebuilt.
             itinerary = generate_itinerary(
                 destination=destination,
                 num_days=int(num_days),
                 total_budget=int(total_budget) if total_budget > 0 else None,
                 interests=list(interests),
                 travel_type=travel_type.lower(),
-                places_data=places_data,
             )
 
         st.success("Itinerary ready. 🎉")
@@ -199,27 +139,30 @@ def main() -> None:
         st.subheader("Day-wise itinerary")
         for day in itinerary["days"]:
             with st.expander(f"Day {day['day']} – {day['focus']}"):
-                st.write(day["description"])
-                st.write(f"**Estimated cost for this day:** ₹{day['estimated_cost']:.0f}")
-
+                # Build the whole day as one markdown block: a single
+                # element renders much faster than one per line.
+                blocks = [
+                    day["description"],
+                    f"**Estimated cost for this day:** ₹{day['estimated_cost']:.0f}",
+                ]
                 for place in day["places"]:
-                    st.markdown(f"**{place['name']}**")
-                    st.write(f"Cost: ₹{place['approx_cost']}")
+                    place_lines = [f"**{place['name']}**", f"Cost: ₹{place['approx_cost']}"]
                     if place.get("tip"):
-                        st.write("Tip: " + place["tip"])
+                        place_lines.append("Tip: " + place["tip"])
                     if place.get("map_link"):
-                        st.markdown(f"[Open in Google Maps]({place['map_link']})")
-                    st.markdown("---")
+                        place_lines.append(f"[Open in Google Maps]({place['map_link']})")
+                    # Two trailing spaces keep each detail on its own line
+                    blocks.append("  \n".join(place_lines))
+                    blocks.append("---")
 
                 if day.get("extra_tips"):
-                    st.write("Extra local tips:")
-                    for tip in day["extra_tips"]:
-                        st.write(f"- {tip}")
+                    blocks.append("Extra local tips:")
+                    blocks.append("\n".join(f"- {tip}" for tip in day["extra_tips"]))
+                st.markdown("\n\n".join(blocks))
 
         if itinerary.get("general_tips"):
             st.subheader("Tips for students")
-            for tip in itinerary["general_tips"]:
-                st.write(f"- {tip}")
+            st.markdown("\n".join(f"- {tip}" for tip in itinerary["general_tips"]))
 
         st.caption(
             "Note: All costs are approximate and meant for learning/demo purposes, "
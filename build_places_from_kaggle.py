@@ -3,14 +3,22 @@ from __future__ import annotations
 import json
 import re
 from collections import Counter, defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from urllib.parse import quote_plus
 
 import kagglehub
+import numpy as np
 import pandas as pd
 
+try:
+    # Optional: much faster JSON encoder; the stdlib one is used without it
+    import orjson
+except ImportError:
+    orjson = None
+
 # Kaggle dataset id for attractions/places
 KAGGLE_DATASET = "saketk511/travel-dataset-guide-to-indias-must-see-places"
 
@@ -21,6 +29,42 @@ TRAVEL_COST_CSV_PATH = Path(__file__).parent / "travel cost.csv"
 # Where to write the final JSON (same file your app already uses)
 OUTPUT_PATH = Path(__file__).parent / "data" / "places_data.json"
 
+# Candidate column names in the attractions CSV, most preferred first.
+CITY_COLUMNS = ["City", "city", "Nearest_City", "Nearest City", "Location"]
+NAME_COLUMNS = ["Place_Name", "Place Name", "Attraction", "Attraction_Name", "Name"]
+CATEGORY_COLUMNS = ["Category", "Type", "Place_Type", "Place Type"]
+DESCRIPTION_COLUMNS = ["Description", "Short_Description", "Famous_For", "Famous For", "Highlights"]
+PRICE_COLUMNS = [
+    "Ticket_Price",
+    "Ticket Price",
+    "Entry_Fee",
+    "Entry Fee",
+    "Entry_fee",
+    "Entry_Fee_Rs",
+    "Price",
+    "Cost",
+]
+TIME_COLUMNS = [
+    "Time_required_hours",
+    "Time_Required",
+    "Time Required",
+    "Ideal_Visit_Duration",
+    "Ideal Visit Duration",
+    "Duration",
+]
+
+# Only these columns are ever read, so the CSV parser can skip the rest.
+KNOWN_COLUMNS = set(
+    CITY_COLUMNS + NAME_COLUMNS + CATEGORY_COLUMNS + DESCRIPTION_COLUMNS + PRICE_COLUMNS + TIME_COLUMNS
+)
+
+# Candidate cost columns in the travel-cost CSV.
+ACCOMMODATION_COST_COLUMNS = ["Accomdation_Cost", "Accomadation_Cost", "Accommodation_Cost", "Cost"]
+
+# Runs of digits inside free-text prices, durations and cost ranges.
+# Compiled once and shared by every column parser below.
+_DIGITS_RE = re.compile(r"(\d+)")
+
 
 def download_kaggle_dataset() -> Path:
     """Download the Kaggle dataset using kagglehub and return its folder path."""
@@ -37,33 +81,29 @@ def find_csv_file(root: Path) -> Path:
     return csv_files[0]
 
 
+def existing_columns(df: pd.DataFrame, candidates: List[str]) -> List[str]:
+    """Return the candidates that exist in df, keeping their order."""
+    present = set(df.columns)
+    return [col for col in candidates if col in present]
+
+
 def pick_first_existing_column(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
     """Return the first column name from candidates that exists in df, else None."""
-    for col in candidates:
-        if col in df.columns:
-            return col
-    return None
+    columns = existing_columns(df, candidates)
+    return columns[0] if columns else None
 
 
-def _parse_cost_range(text: str) -> Optional[int]:
-    """Parse a string like "500 - 3000" and return a *student-friendly* cost.
+def _parse_cost_ranges(values: pd.Series) -> pd.Series:
+    """Parse strings like "500 - 3000" and return a *student-friendly* cost per row.
 
     We keep it simple: take the **lowest** number we can find, because
     students usually look for the cheapest reasonable accommodation.
+    The whole column is parsed at once; rows without any number are
+    left out of the result.
     """
-
-    if not isinstance(text, str):
-        text = str(text)
-
-    cleaned = text.replace(",", " ")
-    digits = re.findall(r"\d+", cleaned)
-    if not digits:
-        return None
-
-    values = [int(d) for d in digits]
-    if not values:
-        return None
-    return min(values)
+    cleaned = values.dropna().astype(str).str.replace(",", " ", regex=False)
+    digits = cleaned.str.extractall(_DIGITS_RE)[0]
+    return digits.astype(int).groupby(level=0).min()
 
 
 def load_travel_costs(path: Path = TRAVEL_COST_CSV_PATH) -> Dict[str, int]:
@@ -83,14 +123,14 @@ def load_travel_costs(path: Path = TRAVEL_COST_CSV_PATH) -> Dict[str, int]:
         print(f"[INFO] Travel cost CSV not found at {path}; using place-based costs only.")
         return {}
 
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, usecols=lambda c: c == "City" or c in ACCOMMODATION_COST_COLUMNS)
     if "City" not in df.columns:
         print("[INFO] 'City' column missing in travel cost CSV; skipping accommodation data.")
         return {}
 
     # Column that stores textual cost ranges
     cost_col: Optional[str] = None
-    for candidate in ["Accomdation_Cost", "Accomadation_Cost", "Accommodation_Cost", "Cost"]:
+    for candidate in ACCOMMODATION_COST_COLUMNS:
         if candidate in df.columns:
             cost_col = candidate
             break
@@ -99,185 +139,177 @@ def load_travel_costs(path: Path = TRAVEL_COST_CSV_PATH) -> Dict[str, int]:
         print("[INFO] No accommodation cost column found in travel cost CSV; skipping.")
         return {}
 
-    costs_by_city: Dict[str, List[int]] = defaultdict(list)
+    costs = _parse_cost_ranges(df[cost_col])
+    cities = df["City"].astype(str).str.strip().loc[costs.index]
+    keep = (costs > 0) & (cities != "")
+
+    # Use the *minimum* low-end cost across all accommodation types
+    # to keep it budget-friendly for students.
+    per_city = costs[keep].groupby(cities[keep], sort=False).min()
+    summary: Dict[str, int] = {str(city): int(cost) for city, cost in per_city.items()}
+
+    print(f"[INFO] Loaded accommodation costs for {len(summary)} cities from '{path.name}'.")
+    return summary
+
+
+# Keyword groups used to map free text into our small category set.
+# Groups are listed in priority order, which also fixes the order of
+# the categories each place ends up with.
+CATEGORY_KEYWORDS: List[Tuple[List[str], List[str]]] = [
+    (["beach", "lake", "river", "waterfall", "hill", "mountain", "park", "garden"], ["nature"]),
+    (["trek", "adventure", "paragliding", "rafting", "water sports"], ["adventure"]),
+    (["temple", "church", "mosque", "monastery", "gurudwara", "shrine"], ["culture", "history"]),
+    (["fort", "palace", "museum", "monument", "heritage"], ["history", "culture"]),
+    (["market", "bazaar", "shopping", "mall"], ["shopping"]),
+    (["food", "restaurant", "dhaba", "cafe", "street food"], ["food"]),
+    (["relax", "chill", "sunset", "sunrise"], ["relax"]),
+]
+
+# Each keyword group gets one bit, so the groups hit by a text fit in a
+# small int that indexes the precomputed category lists below.
+_KEYWORD_BIT: Dict[str, int] = {
+    keyword: 1 << group for group, (keywords, _) in enumerate(CATEGORY_KEYWORDS) for keyword in keywords
+}
+
+# One pass over the text finds every keyword. The lookahead lets matches
+# overlap ("street food" also contains "food"), so this behaves exactly
+# like checking each keyword as a plain substring.
+_KEYWORD_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in _KEYWORD_BIT) + "))")
+
+
+def _categories_for_bits(bits: int) -> Tuple[str, ...]:
+    """Ordered, de-duplicated categories for a set of keyword-group bits."""
+    cats: List[str] = []
+    for group, (_, group_cats) in enumerate(CATEGORY_KEYWORDS):
+        if bits & (1 << group):
+            for c in group_cats:
+                if c not in cats:
+                    cats.append(c)
+
+    # Fallback if we couldn't infer anything
+    return tuple(cats) or ("culture",)
+
+
+_CATEGORIES_BY_BITS = [_categories_for_bits(bits) for bits in range(1 << len(CATEGORY_KEYWORDS))]
+
+
+def _categories_from_keywords(hits: List[str]) -> List[str]:
+    """Turn the keywords found in one text into its list of categories."""
+    bits = 0
+    for h in hits:
+        bits |= _KEYWORD_BIT[h]
+    return list(_CATEGORIES_BY_BITS[bits])
+
 
-    for _, row in df.iterrows():
-        city_raw = row.get("City", "")
-        city = str(city_raw).strip()
-        if not city:
+def infer_categories(raw: pd.Series) -> pd.Series:
+    """Map free‑text category/description of every row into our small category set."""
+    hits = raw.fillna("").astype(str).str.lower().str.findall(_KEYWORD_RE)
+    return hits.map(_categories_from_keywords)
+
+
+def infer_cost(df: pd.DataFrame) -> pd.Series:
+    """Infer approximate student cost in INR for every row from possible price columns."""
+    parsed: List[pd.Series] = []
+    # Try a list of likely price/fee columns; earlier columns win per row
+    for col in existing_columns(df, PRICE_COLUMNS):
+        values = df[col]
+        # If it's already numeric
+        if pd.api.types.is_numeric_dtype(values):
+            parsed.append(values.where(values >= 0))
             continue
 
-        cost_val = _parse_cost_range(str(row.get(cost_col, "")))
-        if cost_val is None or cost_val <= 0:
+        # If it's a string like "Free", "100-200", "₹150"; missing cells
+        # are dropped once here and come back as NaN on reindex
+        text = values.dropna().astype(str).str.strip().str.lower()
+        costs = text.str.extract(_DIGITS_RE, expand=False).astype(float)
+        costs = costs.mask(text.str.contains("free", regex=False), 0)
+        parsed.append(costs.reindex(df.index))
+
+    if not parsed:
+        # Fallback: a generic low student budget
+        return pd.Series(300, index=df.index, dtype=int)
+    costs = pd.concat(parsed, axis=1).bfill(axis=1).iloc[:, 0]
+    return costs.fillna(300).astype(int)
+
+
+def infer_time_required_hours(df: pd.DataFrame) -> pd.Series:
+    """Infer approximate time required to visit each place, in hours."""
+    parsed: List[pd.Series] = []
+    for col in existing_columns(df, TIME_COLUMNS):
+        values = df[col]
+        if pd.api.types.is_numeric_dtype(values):
+            hours = values.where(values > 0).astype(float)
+            # Below 24 we treat it as hours; >=24 probably means minutes
+            parsed.append(hours.where(hours < 24, hours / 60.0))
             continue
 
-        costs_by_city[city].append(cost_val)
+        # Look for patterns like "2-3 hours", "3 hrs", "45 min"
+        text = values.dropna().astype(str).str.strip().str.lower()
+        first = text.str.extract(_DIGITS_RE, expand=False).astype(float)
+        is_minutes = text.str.contains("min", regex=False)
+        hours = first.mask(is_minutes, first / 60.0)
+        parsed.append(hours.clip(lower=1.0).reindex(df.index))
 
-    summary: Dict[str, int] = {}
-    for city, values in costs_by_city.items():
-        # Use the *minimum* low-end cost across all accommodation types
-        # to keep it budget-friendly for students.
-        summary[city] = int(min(values))
+    if not parsed:
+        # Fallback: 3 hours per place
+        return pd.Series(3.0, index=df.index)
+    hours = pd.concat(parsed, axis=1).bfill(axis=1).iloc[:, 0]
+    return hours.fillna(3.0).astype(float)
 
-    print(f"[INFO] Loaded accommodation costs for {len(summary)} cities from '{path.name}'.")
-    return summary
 
+def build_map_link(place_names: pd.Series, city_names: pd.Series) -> pd.Series:
+    """Build a Google Maps search URL for every place."""
+    queries = (place_names + " " + city_names).map(quote_plus)
+    return "https://www.google.com/maps/search/?api=1&query=" + queries
 
-def infer_categories(raw: str) -> List[str]:
-    """Map free‑text category/description into our small category set."""
-    text = (raw or "").lower()
 
-    cats: List[str] = []
-    if any(w in text for w in ["beach", "lake", "river", "waterfall", "hill", "mountain", "park", "garden"]):
-        cats.append("nature")
-    if any(w in text for w in ["trek", "adventure", "paragliding", "rafting", "water sports"]):
-        cats.append("adventure")
-    if any(w in text for w in ["temple", "church", "mosque", "monastery", "gurudwara", "shrine"]):
-        cats.extend(["culture", "history"])
-    if any(w in text for w in ["fort", "palace", "museum", "monument", "heritage"]):
-        if "history" not in cats:
-            cats.append("history")
-        if "culture" not in cats:
-            cats.append("culture")
-    if any(w in text for w in ["market", "bazaar", "shopping", "mall"]):
-        cats.append("shopping")
-    if any(w in text for w in ["food", "restaurant", "dhaba", "cafe", "street food"]):
-        cats.append("food")
-    if any(w in text for w in ["relax", "chill", "sunset", "sunrise"]):
-        cats.append("relax")
+def infer_why(df: pd.DataFrame, city_names: pd.Series) -> pd.Series:
+    """Build a short 'why recommended' text for every row."""
+    texts: List[pd.Series] = []
+    for col in existing_columns(df, DESCRIPTION_COLUMNS):
+        text = df[col].dropna().astype(str).str.strip()
+        texts.append(text[text != ""].reindex(df.index))
 
-    # Fallback if we couldn't infer anything
-    if not cats:
-        cats.append("culture")
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique = []
-    for c in cats:
-        if c not in seen:
-            seen.add(c)
-            unique.append(c)
-    return unique
-
-
-def infer_cost(row: pd.Series) -> int:
-    """Infer approximate student cost in INR from possible price columns."""
-    # Try a list of likely price/fee columns
-    candidates = [
-        "Ticket_Price",
-        "Ticket Price",
-        "Entry_Fee",
-        "Entry Fee",
-        "Entry_fee",
-        "Entry_Fee_Rs",
-        "Price",
-        "Cost",
-    ]
-    for col in candidates:
-        if col in row.index:
-            value = row[col]
-            if pd.isna(value):
-                continue
-            # If it's already numeric
-            if isinstance(value, (int, float)):
-                if value < 0:
-                    continue
-                return int(value)
-
-            # If it's a string like "Free", "100-200", "₹150"
-            s = str(value).strip().lower()
-            if not s:
-                continue
-            if "free" in s:
-                return 0
-            # Extract digits from the text
-            digits = "".join(ch if ch.isdigit() else " " for ch in s).split()
-            if digits:
-                try:
-                    return int(digits[0])
-                except ValueError:
-                    pass
-
-    # Fallback: a generic low student budget
-    return 300
-
-
-def infer_time_required_hours(row: pd.Series) -> float:
-    """Infer approximate time required to visit the place, in hours."""
-    candidates = [
-        "Time_required_hours",
-        "Time_Required",
-        "Time Required",
-        "Ideal_Visit_Duration",
-        "Ideal Visit Duration",
-        "Duration",
-    ]
-    for col in candidates:
-        if col in row.index:
-            value = row[col]
-            if pd.isna(value):
-                continue
-            if isinstance(value, (int, float)):
-                if value <= 0:
-                    continue
-                # If it looks like minutes, normalise roughly; else treat as hours
-                if value > 0 and value <= 5:
-                    return float(value)
-                if value > 5 and value < 24:
-                    return float(value)
-                # >24 probably means minutes
-                return float(value) / 60.0
-
-            s = str(value).strip().lower()
-            if not s:
-                continue
-            # Look for patterns like "2-3 hours", "3 hrs", "45 min"
-            if "min" in s:
-                digits = "".join(ch if ch.isdigit() else " " for ch in s).split()
-                if digits:
-                    try:
-                        mins = float(digits[0])
-                        return max(1.0, mins / 60.0)
-                    except ValueError:
-                        pass
-            else:
-                digits = "".join(ch if ch.isdigit() else " " for ch in s).split()
-                if digits:
-                    try:
-                        hrs = float(digits[0])
-                        return max(1.0, hrs)
-                    except ValueError:
-                        pass
-
-    # Fallback: 3 hours per place
-    return 3.0
-
-
-def build_map_link(place_name: str, city_name: str) -> str:
-    """Build a Google Maps search URL."""
-    query = quote_plus(f"{place_name} {city_name}")
-    return f"https://www.google.com/maps/search/?api=1&query={query}"
-
-
-def infer_why(row: pd.Series, place_name: str, city_name: str) -> str:
-    """Build a short 'why recommended' text."""
-    for col in ["Description", "Short_Description", "Famous_For", "Famous For", "Highlights"]:
-        if col in row.index and not pd.isna(row[col]):
-            text = str(row[col]).strip()
-            if text:
-                return text
-    return f"Popular place in {city_name} visited by many tourists and students."
-
-
-def infer_student_tip(cost: int) -> str:
-    """Simple, budget-aware student tip."""
-    if cost == 0:
-        return "Great free spot – perfect when your budget is tight."
-    if cost <= 200:
-        return "Low-cost place – you can easily fit this into a student budget."
-    if cost <= 500:
-        return "Plan this along with 1–2 free/low-cost spots to balance your budget."
-    return "Consider sharing transport and food with friends to keep the overall day cost under control."
+    fallback = "Popular place in " + city_names + " visited by many tourists and students."
+    if not texts:
+        return fallback
+    return pd.concat(texts, axis=1).bfill(axis=1).iloc[:, 0].fillna(fallback)
+
+
+# Student tips by cost bucket: free, up to 200, up to 500, above 500 INR.
+_TIP_COST_BOUNDS = np.array([0, 200, 500], dtype=np.int64)
+_STUDENT_TIPS = np.array(
+    [
+        "Great free spot – perfect when your budget is tight.",
+        "Low-cost place – you can easily fit this into a student budget.",
+        "Plan this along with 1–2 free/low-cost spots to balance your budget.",
+        "Consider sharing transport and food with friends to keep the overall day cost under control.",
+    ],
+    dtype=object,
+)
+
+
+def infer_student_tip(costs: pd.Series) -> pd.Series:
+    """Simple, budget-aware student tip for every place cost."""
+    buckets = np.searchsorted(_TIP_COST_BOUNDS, costs.to_numpy(), side="left")
+    return pd.Series(_STUDENT_TIPS[buckets], index=costs.index)
+
+
+def _estimate_daily_cost(place_costs: np.ndarray, accom_cost: Optional[int]) -> int:
+    """Rough daily budget for one city from its place costs and accommodation cost."""
+    # Simple place-based estimate: median place cost × ~2 places/day
+    place_based_daily = 0
+    if place_costs.size:
+        # Only the middle element is needed, so a partial partition is enough
+        middle = place_costs.size // 2
+        mid = int(np.partition(place_costs, middle)[middle])
+        place_based_daily = max(0, mid * 2)
+
+    if accom_cost is not None:
+        # Rough rule: daily budget ≈ accommodation + place-based spends
+        return int(max(300, accom_cost + place_based_daily))
+    # Fallback: if we don't know accommodation, use only places
+    return int(max(300, place_based_daily or 1000))
 
 
 def build_city_level_meta(city_name: str, places: List[Dict[str, Any]], travel_cost_by_city: Dict[str, int]) -> Dict[str, Any]:
@@ -288,10 +320,7 @@ def build_city_level_meta(city_name: str, places: List[Dict[str, Any]], travel_c
     - Travel-cost dataset  -> low-end accommodation cost per city
     """
     # Aggregate categories to form default_focus
-    cat_counter = Counter()
-    for p in places:
-        for c in p.get("categories", []):
-            cat_counter[c] += 1
+    cat_counter = Counter(chain.from_iterable(p.get("categories", ()) for p in places))
 
     if cat_counter:
         top_cats = [c for c, _ in cat_counter.most_common(3)]
@@ -299,23 +328,12 @@ def build_city_level_meta(city_name: str, places: List[Dict[str, Any]], travel_c
     else:
         default_focus = "top highlights"
 
-    # Simple place-based estimate: median place cost × ~2 places/day
-    place_based_daily = 0
-    if places:
-        costs = sorted(p.get("approx_cost", 0) for p in places if p.get("approx_cost", 0) is not None)
-        if costs:
-            mid = costs[len(costs) // 2]
-            place_based_daily = max(0, mid * 2)
-
+    place_costs = np.fromiter(
+        (p.get("approx_cost", 0) for p in places if p.get("approx_cost", 0) is not None),
+        dtype=np.int64,
+    )
     # Accommodation-based estimate from the travel-cost dataset
-    accom_cost = travel_cost_by_city.get(city_name)
-
-    if accom_cost is not None:
-        # Rough rule: daily budget ≈ accommodation + place-based spends
-        avg_daily_cost = int(max(300, accom_cost + place_based_daily))
-    else:
-        # Fallback: if we don't know accommodation, use only places
-        avg_daily_cost = int(max(300, place_based_daily or 1000))
+    avg_daily_cost = _estimate_daily_cost(place_costs, travel_cost_by_city.get(city_name))
 
     general_tips = [
         "Travel with friends to share room and cab costs.",
@@ -345,22 +363,10 @@ def convert_dataframe_to_places_json(df: pd.DataFrame, travel_cost_by_city: Dict
     used to enrich each city's average_daily_cost.
     """
     # Try to locate column names we need
-    city_col = pick_first_existing_column(
-        df,
-        ["City", "city", "Nearest_City", "Nearest City", "Location"]
-    ) or "City"
-    name_col = pick_first_existing_column(
-        df,
-        ["Place_Name", "Place Name", "Attraction", "Attraction_Name", "Name"]
-    ) or "Place_Name"
-    category_col = pick_first_existing_column(
-        df,
-        ["Category", "Type", "Place_Type", "Place Type"]
-    )
-    desc_col = pick_first_existing_column(
-        df,
-        ["Description", "Short_Description", "Famous_For", "Famous For", "Highlights"]
-    )
+    city_col = pick_first_existing_column(df, CITY_COLUMNS) or "City"
+    name_col = pick_first_existing_column(df, NAME_COLUMNS) or "Place_Name"
+    category_col = pick_first_existing_column(df, CATEGORY_COLUMNS)
+    desc_col = pick_first_existing_column(df, DESCRIPTION_COLUMNS)
 
     # Ensure fallback columns exist in the frame (to avoid KeyError later)
     for col in [city_col, name_col]:
@@ -371,29 +377,37 @@ def convert_dataframe_to_places_json(df: pd.DataFrame, travel_cost_by_city: Dict
     # We'll build per-city data here
     city_places: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
-    for _, row in df.iterrows():
-        city_name = str(row.get(city_col, "") or "").strip()
-        if not city_name:
-            city_name = "Unknown City"
-
-        place_name = str(row.get(name_col, "") or "").strip()
+    # Pull out only the columns we need and parse them for the whole
+    # frame at once instead of per row. Missing cells count as empty, so
+    # rows without a place name are skipped and rows without a city go
+    # under "Unknown City" (rather than a literal "nan" name or city).
+    city_names = df[city_col].fillna("").astype(str).str.strip()
+    city_names = city_names.where(city_names != "", "Unknown City")
+    place_names = df[name_col].fillna("").astype(str).str.strip()
+
+    raw_cats = pd.Series("", index=df.index)
+    if desc_col:
+        raw_cats = df[desc_col]
+    if category_col:
+        raw_cats = df[category_col].where(df[category_col].notna(), raw_cats)
+
+    approx_costs = infer_cost(df)
+    rows = zip(
+        city_names.tolist(),
+        place_names.tolist(),
+        infer_categories(raw_cats).tolist(),
+        approx_costs.tolist(),
+        infer_time_required_hours(df).tolist(),
+        infer_why(df, city_names).tolist(),
+        infer_student_tip(approx_costs).tolist(),
+        build_map_link(place_names, city_names).tolist(),
+    )
+    for (city_name, place_name, categories, approx_cost,
+         time_required_hours, why, student_tip, map_link) in rows:
         if not place_name:
             # Skip rows without a proper place name
             continue
 
-        raw_cat = ""
-        if category_col and category_col in row.index and not pd.isna(row[category_col]):
-            raw_cat = str(row[category_col])
-        elif desc_col and desc_col in row.index and not pd.isna(row[desc_col]):
-            raw_cat = str(row[desc_col])
-
-        categories = infer_categories(raw_cat)
-        approx_cost = infer_cost(row)
-        time_required_hours = infer_time_required_hours(row)
-        why = infer_why(row, place_name, city_name)
-        student_tip = infer_student_tip(approx_cost)
-        map_link = build_map_link(place_name, city_name)
-
         place_obj: Dict[str, Any] = {
             "name": place_name,
             "categories": categories,
@@ -423,7 +437,8 @@ def main() -> None:
     csv_path = find_csv_file(dataset_dir)
     print(f"Using CSV file: {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    # Skip columns the conversion never looks at
+    df = pd.read_csv(csv_path, usecols=lambda c: c in KNOWN_COLUMNS)
     print(f"Loaded {len(df)} rows from attractions dataset.")
 
     # Load city-wise accommodation costs from the second Kaggle dataset
@@ -433,8 +448,13 @@ def main() -> None:
     places_json = convert_dataframe_to_places_json(df, travel_cost_by_city)
 
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(places_json, f, ensure_ascii=False, indent=2)
+    # orjson writes UTF-8 bytes directly and is much faster than the
+    # stdlib encoder; both give the same indented, hand-editable file.
+    if orjson is not None:
+        OUTPUT_PATH.write_bytes(orjson.dumps(places_json, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+            json.dump(places_json, f, ensure_ascii=False, indent=2)
 
     print(f"Written processed data to: {OUTPUT_PATH}")
     print("Now you can run the Streamlit app with the new data.")
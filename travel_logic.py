@@ -1,104 +1,268 @@
 import json
+import os
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from urllib.parse import quote_plus
 
 
 DATA_PATH = Path(__file__).parent / "data" / "places_data.json"
 
+# One place after load-time normalization. Missing JSON keys get the
+# defaults the planner would otherwise apply on every read, and fields
+# are plain attributes instead of dict lookups.
+Place = namedtuple("Place", "name categories approx_cost best_for why student_tip")
+
+# Tips shown for every city, before the city's own general tips
+_BASE_TIPS = (
+    "Travel with friends to share room and cab costs.",
+    "Prefer public transport or walking instead of point-to-point cabs.",
+    "Carry a refillable water bottle and basic snacks.",
+    "Check for student discounts at museums and attractions.",
+)
+
+# Shared stand-in for cities without local tips
+_NO_TIPS: Tuple[str, ...] = ()
+
+
+def _to_place(raw: Dict[str, Any]) -> Place:
+    """Convert one place dict from the JSON into a Place.
+
+    `best_for` becomes a frozenset (empty when no travel type is listed);
+    `categories` stays as given because it is shown in the day plan.
+    """
+    return Place(
+        name=raw.get("name"),
+        categories=raw.get("categories", []),
+        approx_cost=raw.get("approx_cost", 0),
+        best_for=frozenset(raw.get("best_for") or ()),
+        why=raw.get("why", "Popular and student-friendly place."),
+        student_tip=raw.get("student_tip", ""),
+    )
+
+
+def _index_places(places: List[Place]) -> Dict[str, Any]:
+    """Map each category and travel type to the positions of matching places.
+
+    Built once per city so that filtering becomes a few set operations
+    instead of scanning every place for every request.
+    """
+    by_category: Dict[str, Set[int]] = {}
+    by_travel: Dict[str, Set[int]] = {}
+    no_best_for: Set[int] = set()
+    for i, p in enumerate(places):
+        for category in p.categories:
+            by_category.setdefault(category, set()).add(i)
+        if p.best_for:
+            for travel_type in p.best_for:
+                by_travel.setdefault(travel_type, set()).add(i)
+        else:
+            # No preference listed: suitable for every travel type
+            no_best_for.add(i)
+
+    return {
+        "by_category": by_category,
+        "by_travel": by_travel,
+        "no_best_for": no_best_for,
+    }
+
+
+def _resolve_map_links(places: List[Dict[str, Any]], city_label: str) -> List[str]:
+    """Return each place's own map link, or a Google Maps search URL as fallback."""
+    raw_links = [p.get("map_link") or "" for p in places]
+    missing = [i for i, link in enumerate(raw_links) if not link.startswith("http")]
+    # Fallback: build a stable Google Maps search URL using place name + city,
+    # quoting all the missing queries in one pass
+    queries = [f"{places[i].get('name', '')} {city_label}" for i in missing]
+    for i, query in zip(missing, map(quote_plus, queries)):
+        raw_links[i] = f"https://www.google.com/maps/search/?api=1&query={query}"
+    return raw_links
+
+
+def _place_columns(places: List[Dict[str, Any]], city_label: str) -> Dict[str, Any]:
+    """Split a city's places into parallel lists indexed by position.
+
+    The day planner reads only name ids and costs while choosing places,
+    so keeping them in their own lists (with costs already converted to
+    float) avoids dict lookups and conversions inside its loop. Places
+    that share a name share an id (0..n-1 within the city), so "already
+    used" can be tracked as bits of an int. Map links are resolved here
+    once, since they depend only on the place and the city label.
+    """
+    rows = [_to_place(p) for p in places]
+    name_to_id: Dict[Any, int] = {}
+    return {
+        "city_label": city_label,
+        "name_ids": [name_to_id.setdefault(p.name, len(name_to_id)) for p in rows],
+        "costs": [float(p.approx_cost or 0) for p in rows],
+        "map_links": _resolve_map_links(places, city_label),
+        "places": rows,
+    }
+
+
+def _prepare_city(city_key: str, city_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in missing city keys and attach the planner's columns and index.
+
+    After this, every key the planner reads is present, so it can use
+    `city_data[key]` without repeating defaults.
+    """
+    city_data.setdefault("city_name", None)
+    city_data.setdefault("places", [])
+    city_data.setdefault("default_focus", "top highlights")
+    city_data.setdefault("general_tips", ())
+    # A tuple, since every planned day (and every cached itinerary)
+    # shares it as "extra_tips"
+    city_data["local_tips"] = tuple(city_data.get("local_tips") or ()) or _NO_TIPS
+
+    columns = _place_columns(city_data["places"], city_data["city_name"] or city_key)
+    city_data["_columns"] = columns
+    city_data["_index"] = _index_places(columns["places"])
+    return city_data
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime: float) -> Dict[str, Any]:
+    """Read and parse one JSON file; cached per path and modification time."""
+    with open(path_str, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    for city_key, city_data in data.items():
+        _prepare_city(city_key, city_data)
+    return data
+
 
 def load_places_data(path: Optional[Path] = None) -> Dict[str, Any]:
     """Load sample city and places data from JSON.
 
     Data is intentionally small and human-readable so that it can be
     explained easily during viva and modified by students.
+
+    The file is parsed only once per process and re-read when it
+    changes on disk, so treat the returned dict as read-only.
     """
-    data_path = path or DATA_PATH
-    with open(data_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    data_path = Path(path or DATA_PATH).resolve()
+    return _load_cached(str(data_path), os.path.getmtime(data_path))
 
 
-def _filter_places(city_data: Dict[str, Any], interests: List[str], travel_type: str) -> List[Dict[str, Any]]:
+def _filter_places(
+    city_data: Dict[str, Any],
+    columns: Dict[str, Any],
+    interests: List[str],
+    travel_type: str,
+) -> List[int]:
     """Filter places using simple rule-based logic.
 
+    Returns the positions of the chosen places in the city's `columns`.
+
     Rules:
     - Prefer places that match at least one selected interest.
     - Prefer places that are marked as suitable for the chosen travel type.
     - If filtering removes everything, gracefully fall back to all places
       so that the user still gets a complete plan.
     """
-    places = list(city_data.get("places", []))
+    places = columns["places"]
+    index = city_data["_index"]
+    # Each distinct interest is looked up once
+    interests_set = frozenset(interests)
+
+    # None means "all places", so nothing is allocated until a filter applies
+    selected: Optional[Set[int]] = None
 
     # Interest-based filtering
-    if interests:
-        interested = [
-            p
-            for p in places
-            if any(i in p.get("categories", []) for i in interests)
-        ]
+    if interests_set:
+        interested = set().union(*(index["by_category"].get(i, set()) for i in interests_set))
         if interested:
-            places = interested
+            selected = interested
 
     # Travel-type filtering (solo / friends)
     if travel_type:
-        suitable = [
-            p
-            for p in places
-            if not p.get("best_for") or travel_type in p.get("best_for", [])
-        ]
+        suitable = index["by_travel"].get(travel_type, set()) | index["no_best_for"]
+        if selected is not None:
+            suitable &= selected
         if suitable:
-            places = suitable
+            selected = suitable
+
+    if selected is None:
+        return list(range(len(places)))
+    # Keep the original data order for the selected places
+    return sorted(selected)
+
+
+def _select_places(
+    available_places: List[int],
+    name_ids: List[int],
+    costs: List[float],
+    used_mask: int,
+    budget_cap: float,
+) -> Tuple[List[int], float, int]:
+    """Greedily pick up to 3 unused places whose total cost stays under `budget_cap`.
+
+    `available_places` must be sorted cheapest first. `used_mask` has bit
+    `name_ids[i]` set for every place name already planned; returns the
+    chosen positions, their total cost and the mask with them added.
+    """
+    selected: List[int] = []
+    spent = 0.0
+    # Only names planned on earlier days are skipped; a name listed twice
+    # in the data may still fill two slots of the same day.
+    used_before = used_mask
 
-    return places
+    for i in available_places:
+        # Prefer unused places (the list is already cheapest first)
+        if used_before >> name_ids[i] & 1:
+            continue
+        cost = costs[i]
+        # Cheapest first, so if this one does not fit, none after it will
+        if spent + cost > budget_cap:
+            break
+        selected.append(i)
+        used_mask |= 1 << name_ids[i]
+        spent += cost
+        # Keep days small and realistic (2–4 activities)
+        if len(selected) >= 3:
+            break
+
+    return selected, spent, used_mask
 
 
 def _build_day_plan(
     day_number: int,
-    available_places: List[Dict[str, Any]],
-    daily_budget: Optional[float],
-    used_place_names: Set[str],
-    city_data: Dict[str, Any],
-    interests: List[str],
-    city_name: str,
-) -> Dict[str, Any]:
+    available_places: List[int],
+    columns: Dict[str, Any],
+    budget_cap: float,
+    used_mask: int,
+    focus_title: str,
+    focus_lower: str,
+    city_label: str,
+    local_tips: Sequence[str],
+) -> Tuple[Dict[str, Any], int]:
     """Create a simple day plan using greedy, budget-aware selection.
 
     This is **AI-style logic without ML training**:
     - Try to choose cheaper places first.
     - Try not to repeat the same place on multiple days.
     - Respect (approximately) the daily budget.
+
+    `available_places` holds positions into the parallel `columns`
+    lists and must already be sorted by approximate cost (cheapest
+    first); generate_itinerary sorts it once for all days.
+
+    Returns the day plan and `used_mask` updated with the chosen places.
     """
-    # Prefer unused places and sort by approximate cost (cheapest first)
-    candidates = [p for p in available_places if p.get("name") not in used_place_names]
+    selected, spent, used_mask = _select_places(
+        available_places, columns["name_ids"], columns["costs"], used_mask, budget_cap
+    )
 
     # IMPORTANT change:
     # If there are no unused places left, we *do not* repeat the
     # same attractions again. Instead, we will keep the day light
     # with no new places, so that the itinerary reflects the
     # limited data for this city (good viva point).
-    candidates.sort(key=lambda p: p.get("approx_cost", 0))
-
-    selected: List[Dict[str, Any]] = []
-    spent = 0.0
-
-    for place in candidates:
-        cost = float(place.get("approx_cost", 0) or 0)
-        # Allow a small 20% flexibility over the daily budget
-        if daily_budget is not None and spent + cost > daily_budget * 1.2:
-            continue
-        selected.append(place)
-        used_place_names.add(place.get("name", ""))
-        spent += cost
-        # Keep days small and realistic (2–4 activities)
-        if len(selected) >= 3:
-            break
-
-    focus = ", ".join(interests) if interests else city_data.get("default_focus", "top highlights")
-    city_label = city_data.get("city_name") or city_name or "the city"
 
     if selected:
         description = (
-            f"Day {day_number}: Focus on {focus.lower()} in and around {city_label}. "
+            f"Day {day_number}: Focus on {focus_lower} in and around {city_label}. "
             "The plan mixes student-friendly and budget-conscious options."
         )
     else:
@@ -109,35 +273,31 @@ def _build_day_plan(
             "for rest, local walks, markets and your own favourite spots."
         )
 
+    # Only the chosen places are looked up as full records
+    places = columns["places"]
     day_places = []
-    for p in selected:
-        raw_link = p.get("map_link", "") or ""
-        if raw_link.startswith("http"):
-            map_link = raw_link
-        else:
-            # Fallback: build a stable Google Maps search URL using place name + city
-            query = quote_plus(f"{p.get('name', '')} {city_label}")
-            map_link = f"https://www.google.com/maps/search/?api=1&query={query}"
-
+    for i in selected:
+        p = places[i]
         day_places.append(
             {
-                "name": p.get("name"),
-                "categories": p.get("categories", []),
-                "approx_cost": p.get("approx_cost", 0),
-                "why": p.get("why", "Popular and student-friendly place."),
-                "tip": p.get("student_tip", ""),
-                "map_link": map_link,
+                "name": p.name,
+                "categories": p.categories,
+                "approx_cost": p.approx_cost,
+                "why": p.why,
+                "tip": p.student_tip,
+                "map_link": columns["map_links"][i],
             }
         )
 
-    return {
+    day_plan = {
         "day": day_number,
-        "focus": focus.title() if focus else "Highlights",
+        "focus": focus_title,
         "description": description,
         "places": day_places,
         "estimated_cost": spent,
-        "extra_tips": city_data.get("local_tips", []),
+        "extra_tips": local_tips,
     }
+    return day_plan, used_mask
 
 
 def generate_itinerary(
@@ -158,15 +318,28 @@ def generate_itinerary(
 
     No heavy ML or training is required – only Python conditions, loops
     and simple scoring logic.
+
+    Without `places_data`, results for the bundled data file are cached
+    per query until the file changes, so treat the returned dict as
+    read-only.
     """
+    if places_data is None:
+        data_path = DATA_PATH.resolve()
+        return _generate_cached(
+            str(data_path),
+            os.path.getmtime(data_path),
+            destination,
+            num_days,
+            total_budget,
+            tuple(interests),
+            travel_type,
+        )
+
     # Number of days the user requested in the UI.
     if num_days <= 0:
         num_days = 1
     requested_days = num_days
 
-    if places_data is None:
-        places_data = load_places_data()
-
     # If the destination is unknown, fall back to the first known city
     # but keep the original destination name for display.
     if destination in places_data:
@@ -176,9 +349,24 @@ def generate_itinerary(
 
     city_data = places_data[city_key]
     city_name = destination
-
-    # Filter places once based on interests and travel type.
-    available_places = _filter_places(city_data, interests, travel_type)
+    if "_columns" not in city_data:
+        # Data passed in by the caller rather than loaded here; prepare
+        # a copy so the caller's dict is left untouched.
+        city_data = _prepare_city(city_key, dict(city_data))
+
+    # Map links in the prepared columns were built with this label; an
+    # unknown destination on a city without "city_name" needs its own.
+    city_label = city_data["city_name"] or city_name or "the city"
+    columns = city_data["_columns"]
+    if columns["city_label"] != city_label:
+        columns = _place_columns(city_data["places"], city_label)
+
+    # Filter places once based on interests and travel type, then sort
+    # them by approximate cost (cheapest first) once instead of once per day.
+    available_places = sorted(
+        _filter_places(city_data, columns, interests, travel_type),
+        key=columns["costs"].__getitem__,
+    )
 
     # How many unique attractions does this city currently have for the
     # given interests and travel type?
@@ -205,31 +393,36 @@ def generate_itinerary(
     daily_budget: Optional[float] = None
     if total_budget is not None and total_budget > 0:
         daily_budget = total_budget / float(planned_days)
+    # Allow a small 20% flexibility over the daily budget
+    budget_cap = daily_budget * 1.2 if daily_budget is not None else float("inf")
 
-    used_place_names: Set[str] = set()
+    # Per-city values that are the same for every day
+    focus = ", ".join(interests) if interests else city_data["default_focus"]
+    focus_title = focus.title() if focus else "Highlights"
+    focus_lower = focus.lower() if focus else ""
+    local_tips = city_data["local_tips"]
+
+    # Bit n is set once the place name with id n has been planned
+    used_mask = 0
     days: List[Dict[str, Any]] = []
-    total_estimated_cost = 0.0
 
     for day in range(1, planned_days + 1):
-        day_plan = _build_day_plan(
+        day_plan, used_mask = _build_day_plan(
             day_number=day,
             available_places=available_places,
-            daily_budget=daily_budget,
-            used_place_names=used_place_names,
-            city_data=city_data,
-            interests=interests,
-            city_name=city_name,
+            columns=columns,
+            budget_cap=budget_cap,
+            used_mask=used_mask,
+            focus_title=focus_title,
+            focus_lower=focus_lower,
+            city_label=city_label,
+            local_tips=local_tips,
         )
         days.append(day_plan)
-        total_estimated_cost += float(day_plan.get("estimated_cost", 0) or 0)
 
-    general_tips = [
-        "Travel with friends to share room and cab costs.",
-        "Prefer public transport or walking instead of point-to-point cabs.",
-        "Carry a refillable water bottle and basic snacks.",
-        "Check for student discounts at museums and attractions.",
-    ]
-    general_tips.extend(city_data.get("general_tips", []))
+    total_estimated_cost = sum(day_plan["estimated_cost"] for day_plan in days)
+
+    general_tips = [*_BASE_TIPS, *city_data["general_tips"]]
 
     return {
         "destination": city_name,
@@ -242,3 +435,24 @@ def generate_itinerary(
         "days": days,
         "general_tips": general_tips,
     }
+
+
+@lru_cache(maxsize=1024)
+def _generate_cached(
+    path_str: str,
+    mtime: float,
+    destination: str,
+    num_days: int,
+    total_budget: Optional[int],
+    interests: Tuple[str, ...],
+    travel_type: str,
+) -> Dict[str, Any]:
+    """Plan one query against one version of a data file; see generate_itinerary."""
+    return generate_itinerary(
+        destination,
+        num_days,
+        total_budget,
+        list(interests),
+        travel_type,
+        places_data=_load_cached(path_str, mtime),
+    )